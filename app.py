@@ -7,48 +7,238 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from tkinter import font as tkfont
 import threading
-from PIL import Image, ImageTk
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageOps, ImageTk
 import requests
+from requests.adapters import HTTPAdapter
+from collections import OrderedDict
+from pathlib import Path
 from io import BytesIO
-import time
-import pandas as pd
+import hashlib
 from recommendation_engine import RecommendationEngine
 import os
 
 
+# Per-user cache for downloaded covers
+CACHE_DIR = Path.home() / '.cache' / 'bookrec'
+
+
+def _set_label_image(label, image):
+    """Show an image on a label and keep the reference Tk needs to avoid GC."""
+    label.config(image=image)
+    label.image = image
+
+
 class ImageCache:
-    """Cache for book cover images."""
+    """LRU cache for book cover images, optionally backed by a directory on disk."""
     
-    def __init__(self, max_size=100):
-        self.cache = {}
+    def __init__(self, max_size=100, disk_dir=None):
+        self.cache = OrderedDict()
         self.max_size = max_size
-        self.access_times = {}
+        # Pool threads and Tk callbacks use the cache concurrently
+        self._lock = threading.Lock()
+        self.disk_dir = None
+        if disk_dir is not None:
+            try:
+                disk_dir = Path(disk_dir)
+                disk_dir.mkdir(parents=True, exist_ok=True)
+                self.disk_dir = disk_dir
+            except OSError:
+                # Fall back to memory-only caching
+                pass
+    
+    def _disk_path(self, url):
+        """Path of the cached cover file for a URL."""
+        # 128-bit BLAKE2s: fast on short inputs and ample for a cache key
+        key = hashlib.blake2s(url.encode(), digest_size=16).hexdigest()
+        return self.disk_dir / (key + '.png')
     
     def get(self, url):
-        """Get image from cache."""
-        if url in self.cache:
-            self.access_times[url] = time.time()
-            return self.cache[url]
-        return None
-    
-    def set(self, url, image):
-        """Store image in cache."""
-        if len(self.cache) >= self.max_size and self.access_times:
-            # Remove least recently used
+        """Get image from memory, falling back to the disk cache."""
+        with self._lock:
+            img = self.cache.get(url)
+            if img is not None:
+                self.cache.move_to_end(url)
+                return img
+        
+        if self.disk_dir is None:
+            return None
+        try:
+            with Image.open(self._disk_path(url)) as source:
+                img = ImageTk.PhotoImage(source)
+        except (OSError, ValueError):
+            return None
+        self.set(url, img)
+        return img
+    
+    def set(self, url, image, source=None):
+        """Store image in cache; if the PIL source image is given, persist it to disk."""
+        if source is not None and self.disk_dir is not None:
+            path = self._disk_path(url)
+            tmp_path = path.with_suffix('.tmp')
             try:
-                lru_url = min(self.access_times, key=self.access_times.get)
-                del self.cache[lru_url]
-                del self.access_times[lru_url]
-            except (ValueError, KeyError):
-                # If access_times is out of sync, remove a random item
-                if self.cache:
-                    random_url = next(iter(self.cache))
-                    del self.cache[random_url]
-                    if random_url in self.access_times:
-                        del self.access_times[random_url]
-        
-        self.cache[url] = image
-        self.access_times[url] = time.time()
+                source.save(tmp_path, 'PNG', optimize=True)
+                os.replace(tmp_path, path)
+            except OSError:
+                pass
+        
+        with self._lock:
+            if url in self.cache:
+                self.cache.move_to_end(url)
+                self.cache[url] = image
+                return
+            
+            self.cache[url] = image
+            # Remove least recently used
+            while len(self.cache) > self.max_size:
+                self.cache.popitem(last=False)
+
+
+class BookCard:
+    """Widgets for one popular-book card, built once and reused across refreshes."""
+    
+    def __init__(self, parent, colors, fonts, default_image):
+        self.default_image = default_image
+        # Cover URL still to be downloaded once the card is on screen
+        self.pending_url = None
+        self.frame = tk.Frame(
+            parent,
+            bg=colors['card_bg'],
+            relief=tk.RAISED,
+            borderwidth=1
+        )
+        
+        # Image
+        self.image_label = tk.Label(self.frame, bg=colors['card_bg'])
+        _set_label_image(self.image_label, default_image)
+        self.image_label.pack(pady=10)
+        
+        # Title
+        self.title_label = tk.Label(
+            self.frame,
+            font=fonts['body10b'],
+            bg=colors['card_bg'],
+            fg=colors['text'],
+            wraplength=200,
+            justify=tk.CENTER
+        )
+        self.title_label.pack(pady=5, padx=10)
+        
+        # Author
+        self.author_label = tk.Label(
+            self.frame,
+            font=fonts['body9'],
+            bg=colors['card_bg'],
+            fg=colors['text_light'],
+            wraplength=200
+        )
+        self.author_label.pack(pady=2, padx=10)
+        
+        # Ratings
+        self.rating_label = tk.Label(
+            self.frame,
+            font=fonts['body9'],
+            bg=colors['card_bg'],
+            fg=colors['accent']
+        )
+        self.rating_label.pack(pady=2)
+        
+        # Weighted score
+        self.score_label = tk.Label(
+            self.frame,
+            font=fonts['body8'],
+            bg=colors['card_bg'],
+            fg=colors['text_light']
+        )
+        self.score_label.pack(pady=2)
+    
+    def update(self, book_data):
+        """Show a different book in this card."""
+        self.pending_url = None
+        # Drop the previous cover so it can be freed unless the cache holds it
+        _set_label_image(self.image_label, self.default_image)
+        self.image_label.cover_url = None
+        self.title_label.config(text=book_data['title_short'])
+        self.author_label.config(text=f"by {book_data.get('Book-Author') or 'Unknown'}")
+        self.rating_label.config(text=book_data['rating_str'])
+        self.score_label.config(text=book_data['score_str'])
+
+
+class RecommendationCard:
+    """Widgets for one recommendation card, built once and reused across searches."""
+    
+    BAR_WIDTH = 300
+    
+    def __init__(self, parent, colors, fonts):
+        self.frame = tk.Frame(
+            parent,
+            bg=colors['card_bg'],
+            relief=tk.RAISED,
+            borderwidth=1
+        )
+        
+        # Content frame
+        content_frame = tk.Frame(self.frame, bg=colors['card_bg'])
+        content_frame.pack(fill=tk.X, padx=20, pady=15)
+        
+        # Book title
+        self.title_label = tk.Label(
+            content_frame,
+            font=fonts['body12b'],
+            bg=colors['card_bg'],
+            fg=colors['text'],
+            anchor=tk.W
+        )
+        self.title_label.pack(anchor=tk.W, pady=5)
+        
+        # Author (packed only when book info is available)
+        self.author_label = tk.Label(
+            content_frame,
+            font=fonts['body10'],
+            bg=colors['card_bg'],
+            fg=colors['text_light'],
+            anchor=tk.W
+        )
+        
+        # Similarity score
+        self.similarity_label = tk.Label(
+            content_frame,
+            font=fonts['body10'],
+            bg=colors['card_bg'],
+            fg=colors['accent'],
+            anchor=tk.W
+        )
+        self.similarity_label.pack(anchor=tk.W, pady=5)
+        
+        # Progress bar for similarity
+        progress_frame = tk.Frame(content_frame, bg=colors['card_bg'])
+        progress_frame.pack(fill=tk.X, pady=5)
+        
+        self.progress_canvas = tk.Canvas(
+            progress_frame,
+            height=20,
+            bg=colors['card_bg'],
+            highlightthickness=0
+        )
+        self.progress_canvas.pack(fill=tk.X)
+        self.progress_canvas.create_rectangle(0, 0, self.BAR_WIDTH, 20, fill='#e0e0e0', outline='')
+        self.progress_fill = self.progress_canvas.create_rectangle(
+            0, 0, 0, 20, fill=colors['accent'], outline=''
+        )
+    
+    def update(self, book_title, similarity, book_info=None):
+        """Show a different recommendation in this card."""
+        self.title_label.config(text=book_title)
+        
+        if book_info:
+            self.author_label.config(text=f"by {book_info.get('Book-Author', 'Unknown')}")
+            self.author_label.pack(anchor=tk.W, pady=2, after=self.title_label)
+        else:
+            self.author_label.pack_forget()
+        
+        self.similarity_label.config(text=f"Similarity: {similarity * 100:.2f}%")
+        self.progress_canvas.coords(self.progress_fill, 0, 0, int(self.BAR_WIDTH * similarity), 20)
 
 
 class BookRecommendationApp:
@@ -65,7 +255,35 @@ class BookRecommendationApp:
         self.loading = False
         
         # Image cache
-        self.image_cache = ImageCache(max_size=200)
+        self.image_cache = ImageCache(
+            max_size=200,
+            disk_dir=CACHE_DIR / 'covers'
+        )
+        
+        # Cover downloads share a bounded worker pool and keep-alive connections
+        self.image_executor = ThreadPoolExecutor(max_workers=8)
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=1)
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
+        
+        # Cover downloads in flight, keyed by URL
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Reusable card widgets
+        self._card_pool = []
+        self._popular_card_count = 0
+        self._rec_card_pool = []
+        
+        # Autocomplete debounce timer and memoized title search
+        self._ac_after_id = None
+        self._search_cached = functools.lru_cache(maxsize=512)(self._search_titles)
+        
+        # Label image updates waiting to be applied on the Tk thread
+        self._pending_img_updates = []
+        self._flush_scheduled = False
+        self._img_updates_lock = threading.Lock()
         
         # Default image (placeholder)
         self.default_image = self._create_placeholder_image()
@@ -82,9 +300,25 @@ class BookRecommendationApp:
             'error': '#e74c3c'
         }
         
+        # Shared fonts (created once, reused by every widget)
+        self.fonts = {
+            'title24b': tkfont.Font(family="Arial", size=24, weight="bold"),
+            'h16b': tkfont.Font(family="Arial", size=16, weight="bold"),
+            'h14b': tkfont.Font(family="Arial", size=14, weight="bold"),
+            'body12b': tkfont.Font(family="Arial", size=12, weight="bold"),
+            'body12': tkfont.Font(family="Arial", size=12),
+            'body11': tkfont.Font(family="Arial", size=11),
+            'body10': tkfont.Font(family="Arial", size=10),
+            'body10b': tkfont.Font(family="Arial", size=10, weight="bold"),
+            'body9': tkfont.Font(family="Arial", size=9),
+            'body8': tkfont.Font(family="Arial", size=8),
+        }
+        
         # Setup UI
         self._setup_ui()
         
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        
         # Load data in background
         self._load_data_async()
     
@@ -96,11 +330,10 @@ class BookRecommendationApp:
     def _setup_ui(self):
         """Setup the user interface."""
         # Title
-        title_font = tkfont.Font(family="Arial", size=24, weight="bold")
         title_label = tk.Label(
             self.root,
             text="📚 Book Recommendation System",
-            font=title_font,
+            font=self.fonts['title24b'],
             bg=self.colors['bg'],
             fg=self.colors['primary']
         )
@@ -113,7 +346,7 @@ class BookRecommendationApp:
             textvariable=self.status_var,
             bg=self.colors['bg'],
             fg=self.colors['text_light'],
-            font=tkfont.Font(family="Arial", size=10)
+            font=self.fonts['body10']
         )
         status_bar.pack(side=tk.BOTTOM, fill=tk.X, pady=5)
         
@@ -121,7 +354,7 @@ class BookRecommendationApp:
         style = ttk.Style()
         style.theme_use('clam')
         style.configure('TNotebook', background=self.colors['bg'])
-        style.configure('TNotebook.Tab', padding=[20, 10], font=tkfont.Font(family="Arial", size=11))
+        style.configure('TNotebook.Tab', padding=[20, 10], font=self.fonts['body11'])
         
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
@@ -145,7 +378,7 @@ class BookRecommendationApp:
         header_label = tk.Label(
             header_frame,
             text="Top 50 Popular Books",
-            font=tkfont.Font(family="Arial", size=16, weight="bold"),
+            font=self.fonts['h16b'],
             bg=self.colors['bg'],
             fg=self.colors['text']
         )
@@ -158,7 +391,7 @@ class BookRecommendationApp:
             command=self._load_popular_books,
             bg=self.colors['primary'],
             fg='white',
-            font=tkfont.Font(family="Arial", size=10),
+            font=self.fonts['body10'],
             padx=15,
             pady=5,
             relief=tk.FLAT,
@@ -184,20 +417,29 @@ class BookRecommendationApp:
         self.popular_scrollable_frame.bind("<Configure>", update_scroll_region)
         
         self.popular_canvas.create_window((0, 0), window=self.popular_scrollable_frame, anchor="nw")
-        self.popular_canvas.configure(yscrollcommand=scrollbar.set)
+        
+        def on_scroll(first, last):
+            # Called whenever the visible region changes (scroll or resize)
+            scrollbar.set(first, last)
+            self._maybe_load_visible()
+        
+        self.popular_canvas.configure(yscrollcommand=on_scroll)
         
         self.popular_canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        # Loading indicator
-        self.popular_loading_label = tk.Label(
+        # Grid of pooled book cards (packed once books are shown)
+        self.popular_cards_frame = tk.Frame(self.popular_scrollable_frame, bg=self.colors['bg'])
+        
+        # Loading / empty indicator
+        self.popular_message_label = tk.Label(
             self.popular_scrollable_frame,
             text="Loading popular books...",
-            font=tkfont.Font(family="Arial", size=12),
+            font=self.fonts['body12'],
             bg=self.colors['bg'],
             fg=self.colors['text_light']
         )
-        self.popular_loading_label.pack(pady=50)
+        self.popular_message_label.pack(pady=50)
     
     def _setup_search_tab(self):
         """Setup the search and recommendations tab."""
@@ -208,7 +450,7 @@ class BookRecommendationApp:
         search_label = tk.Label(
             search_frame,
             text="Search for a book:",
-            font=tkfont.Font(family="Arial", size=12, weight="bold"),
+            font=self.fonts['body12b'],
             bg=self.colors['bg'],
             fg=self.colors['text']
         )
@@ -224,7 +466,7 @@ class BookRecommendationApp:
         self.search_entry = tk.Entry(
             self.search_entry_frame,
             textvariable=self.search_var,
-            font=tkfont.Font(family="Arial", size=11),
+            font=self.fonts['body11'],
             bg='white',
             relief=tk.SOLID,
             borderwidth=1
@@ -237,7 +479,7 @@ class BookRecommendationApp:
             command=self._search_books,
             bg=self.colors['primary'],
             fg='white',
-            font=tkfont.Font(family="Arial", size=10),
+            font=self.fonts['body10'],
             padx=20,
             pady=8,
             relief=tk.FLAT,
@@ -247,12 +489,13 @@ class BookRecommendationApp:
         
         # Autocomplete listbox container (to control visibility)
         self.autocomplete_container = tk.Frame(search_frame, bg=self.colors['bg'])
-        # Don't pack initially
+        # Don't pack initially; _show_ac/_hide_ac track visibility
+        self._ac_visible = False
         
         self.autocomplete_listbox = tk.Listbox(
             self.autocomplete_container,
             height=5,
-            font=tkfont.Font(family="Arial", size=10),
+            font=self.fonts['body10'],
             bg='white',
             relief=tk.SOLID,
             borderwidth=1
@@ -287,11 +530,18 @@ class BookRecommendationApp:
         self.search_canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
+        # Per-search content (messages, searched book, header); rebuilt each search
+        self.search_content_frame = tk.Frame(self.search_scrollable_frame, bg=self.colors['bg'])
+        self.search_content_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Pooled recommendation cards, packed below the per-search content when shown
+        self.rec_cards_frame = tk.Frame(self.search_scrollable_frame, bg=self.colors['bg'])
+        
         # Initial message
         self.search_message_label = tk.Label(
-            self.search_scrollable_frame,
+            self.search_content_frame,
             text="Enter a book title to get recommendations",
-            font=tkfont.Font(family="Arial", size=12),
+            font=self.fonts['body12'],
             bg=self.colors['bg'],
             fg=self.colors['text_light']
         )
@@ -317,209 +567,237 @@ class BookRecommendationApp:
         if self.engine is None:
             return
         
-        # Clear previous content
-        for widget in self.popular_scrollable_frame.winfo_children():
-            widget.destroy()
-        
-        self.popular_loading_label = tk.Label(
-            self.popular_scrollable_frame,
-            text="Loading popular books...",
-            font=tkfont.Font(family="Arial", size=12),
-            bg=self.colors['bg'],
-            fg=self.colors['text_light']
-        )
-        self.popular_loading_label.pack(pady=50)
+        self._show_popular_message("Loading popular books...")
         
         def load_books():
             try:
                 popular_books = self.engine.get_popular_books(50)
-                self.root.after(0, lambda: self._display_popular_books(popular_books))
+                records = self._format_popular_books(popular_books)
+                self.root.after(0, lambda: self._display_popular_books(records))
             except Exception as e:
                 self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to load books: {str(e)}"))
         
         thread = threading.Thread(target=load_books, daemon=True)
         thread.start()
     
-    def _display_popular_books(self, books_df):
+    @staticmethod
+    def _format_popular_books(books_df):
+        """Pre-format card text for all rows at once (runs off the Tk thread)."""
+        books_df = books_df.copy()
+        titles = books_df['Book-Title']
+        books_df['title_short'] = titles.where(titles.str.len() <= 50, titles.str.slice(0, 50) + "...")
+        books_df['rating_str'] = (
+            "⭐ " + books_df['avg_rating'].map('{:.2f}'.format) +
+            " (" + books_df['num_rating'].astype(str) + " ratings)"
+        )
+        books_df['score_str'] = "Weighted Score: " + books_df['weighted_rating'].map('{:.3f}'.format)
+        return books_df.to_dict(orient='records')
+    
+    def _display_popular_books(self, records):
         """Display popular books in a grid."""
-        # Clear loading indicator
-        for widget in self.popular_scrollable_frame.winfo_children():
-            widget.destroy()
-        
-        if books_df.empty:
-            no_books_label = tk.Label(
-                self.popular_scrollable_frame,
-                text="No popular books found",
-                font=tkfont.Font(family="Arial", size=12),
-                bg=self.colors['bg'],
-                fg=self.colors['text_light']
-            )
-            no_books_label.pack(pady=50)
+        if not records:
+            self._show_popular_message("No popular books found")
             return
         
-        # Create grid
-        row = 0
-        col = 0
+        # Clear loading indicator
+        self.popular_message_label.pack_forget()
+        self.popular_cards_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Fill the grid, reusing cards from previous refreshes
         max_cols = 4
         
-        for idx, book_row in books_df.iterrows():
-            self._create_book_card(
-                self.popular_scrollable_frame,
-                book_row,
-                row,
-                col,
-                max_cols
-            )
+        for i, book_row in enumerate(records):
+            if i == len(self._card_pool):
+                self._card_pool.append(
+                    BookCard(self.popular_cards_frame, self.colors, self.fonts, self.default_image)
+                )
+            card = self._card_pool[i]
+            card.update(book_row)
+            
+            row, col = divmod(i, max_cols)
+            card.frame.grid(row=row, column=col, padx=10, pady=10, sticky='nsew')
+            # Configure grid weights
+            self.popular_cards_frame.grid_columnconfigure(col, weight=1)
             
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
+            # Cover is loaded once the card scrolls into view
+            if book_row.get('Image-URL-M'):
+                card.pending_url = book_row['Image-URL-M']
+        
+        # Hide cards left over from a longer previous list
+        for card in self._card_pool[len(records):]:
+            card.frame.grid_remove()
+        self._popular_card_count = len(records)
         
         self.popular_canvas.update_idletasks()
         # Update scroll region after content is displayed
         self.popular_canvas.configure(scrollregion=self.popular_canvas.bbox("all"))
+        self._maybe_load_visible()
     
-    def _create_book_card(self, parent, book_data, row, col, max_cols):
-        """Create a book card widget."""
-        card_frame = tk.Frame(
-            parent,
-            bg=self.colors['card_bg'],
-            relief=tk.RAISED,
-            borderwidth=1
-        )
-        card_frame.grid(row=row, column=col, padx=10, pady=10, sticky='nsew')
-        
-        # Configure grid weights
-        parent.grid_columnconfigure(col, weight=1)
-        
-        # Image
-        image_label = tk.Label(card_frame, image=self.default_image, bg=self.colors['card_bg'])
-        image_label.pack(pady=10)
-        
-        # Load image asynchronously
-        if 'Image-URL-M' in book_data and pd.notna(book_data['Image-URL-M']):
-            self._load_image_async(image_label, book_data['Image-URL-M'])
-        
-        # Title
-        title_text = book_data['Book-Title'][:50] + "..." if len(book_data['Book-Title']) > 50 else book_data['Book-Title']
-        title_label = tk.Label(
-            card_frame,
-            text=title_text,
-            font=tkfont.Font(family="Arial", size=10, weight="bold"),
-            bg=self.colors['card_bg'],
-            fg=self.colors['text'],
-            wraplength=200,
-            justify=tk.CENTER
-        )
-        title_label.pack(pady=5, padx=10)
-        
-        # Author
-        author_text = f"by {book_data.get('Book-Author', 'Unknown')}"
-        author_label = tk.Label(
-            card_frame,
-            text=author_text,
-            font=tkfont.Font(family="Arial", size=9),
-            bg=self.colors['card_bg'],
-            fg=self.colors['text_light'],
-            wraplength=200
-        )
-        author_label.pack(pady=2, padx=10)
-        
-        # Ratings
-        avg_rating = book_data.get('avg_rating', 0)
-        num_ratings = book_data.get('num_rating', 0)
-        weighted_rating = book_data.get('weighted_rating', 0)
-        
-        rating_text = f"⭐ {avg_rating:.2f} ({int(num_ratings)} ratings)"
-        rating_label = tk.Label(
-            card_frame,
-            text=rating_text,
-            font=tkfont.Font(family="Arial", size=9),
-            bg=self.colors['card_bg'],
-            fg=self.colors['accent']
-        )
-        rating_label.pack(pady=2)
+    def _maybe_load_visible(self):
+        """Start cover downloads for cards within (or near) the visible region."""
+        pending = [card for card in self._card_pool[:self._popular_card_count] if card.pending_url]
+        if not pending:
+            return
         
-        # Weighted score
-        score_text = f"Weighted Score: {weighted_rating:.3f}"
-        score_label = tk.Label(
-            card_frame,
-            text=score_text,
-            font=tkfont.Font(family="Arial", size=8),
-            bg=self.colors['card_bg'],
-            fg=self.colors['text_light']
-        )
-        score_label.pack(pady=2)
+        view_height = self.popular_canvas.winfo_height()
+        top = self.popular_canvas.canvasy(0) - view_height / 2
+        bottom = self.popular_canvas.canvasy(0) + view_height * 1.5
+        offset = self.popular_cards_frame.winfo_y()
+        
+        for card in pending:
+            card_top = offset + card.frame.winfo_y()
+            card_bottom = card_top + card.frame.winfo_height()
+            if card_bottom >= top and card_top <= bottom:
+                self._load_image_async(card.image_label, card.pending_url)
+                card.pending_url = None
+    
+    def _show_popular_message(self, text):
+        """Hide the book grid and show a status message instead."""
+        self.popular_cards_frame.pack_forget()
+        self.popular_message_label.config(text=text)
+        self.popular_message_label.pack(pady=50)
     
     def _load_image_async(self, label, url):
         """Load book cover image asynchronously."""
+        # Validate URL
+        if not url or not isinstance(url, str) or not url.startswith('http'):
+            return
+        
+        # Remember which cover this label wants, so late downloads for a
+        # recycled card are ignored
+        label.cover_url = url
+        
+        def show_cached(future=None):
+            cached_img = self.image_cache.get(url)
+            if cached_img:
+                self._queue_img_update(label, cached_img, url)
+        
         def load_image():
             try:
-                # Validate URL
-                if not url or not isinstance(url, str) or not url.startswith('http'):
-                    return
-                
                 # Check cache
                 cached_img = self.image_cache.get(url)
                 if cached_img:
-                    self.root.after(0, lambda img=cached_img: label.config(image=img))
+                    self._queue_img_update(label, cached_img, url)
                     return
                 
                 # Download image
-                response = requests.get(url, timeout=5, stream=True)
-                if response.status_code == 200:
-                    # Check content type
-                    content_type = response.headers.get('content-type', '')
-                    if not content_type.startswith('image/'):
-                        return
-                    
-                    img = Image.open(BytesIO(response.content))
-                    # Convert to RGB if necessary (handles RGBA, P, etc.)
-                    if img.mode != 'RGB':
-                        img = img.convert('RGB')
-                    img = img.resize((128, 192), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(img)
-                    
-                    # Cache image
-                    self.image_cache.set(url, photo)
-                    
-                    # Update label (use default parameter to avoid closure issues)
-                    self.root.after(0, lambda img=photo: label.config(image=img))
-                    label.image = photo  # Keep a reference
+                response = self.http.get(url, timeout=5)
+                if response.status_code != 200:
+                    return
+                # Check content type
+                content_type = response.headers.get('content-type', '')
+                if not content_type.startswith('image/'):
+                    return
+                
+                # draft() lets JPEG downscale during decoding instead of after
+                img = Image.open(BytesIO(response.content))
+                img.draft('RGB', (128, 192))
+                img.load()
+                # Convert to RGB if necessary (handles RGBA, P, etc.)
+                if img.mode != 'RGB':
+                    img = img.convert('RGB')
+                # Box-reduce to ~2x the target, then Lanczos for the last step;
+                # pad to the fixed card size with the placeholder color
+                img.thumbnail((128, 192), Image.Resampling.LANCZOS, reducing_gap=2.0)
+                if img.size != (128, 192):
+                    img = ImageOps.pad(img, (128, 192), color=(224, 224, 224))
+                photo = ImageTk.PhotoImage(img)
+                
+                # Cache image
+                self.image_cache.set(url, photo, source=img)
+                
+                # Update label
+                self._queue_img_update(label, photo, url)
             except (requests.RequestException, IOError, OSError, Exception):
                 # Use default image on error (silently fail)
                 pass
-        
-        thread = threading.Thread(target=load_image, daemon=True)
-        thread.start()
+            finally:
+                with self._inflight_lock:
+                    self._inflight.pop(url, None)
+        
+        # Only one download per URL; other cards wait for it and read the cache
+        with self._inflight_lock:
+            future = self._inflight.get(url)
+            if future is None:
+                try:
+                    future = self.image_executor.submit(load_image)
+                except RuntimeError:
+                    # Executor already shut down (window closing)
+                    return
+                self._inflight[url] = future
+                return
+        future.add_done_callback(show_cached)
+    
+    def _queue_img_update(self, label, photo, url):
+        """Queue a label image update; safe to call from worker threads."""
+        with self._img_updates_lock:
+            self._pending_img_updates.append((label, photo, url))
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        # Coalesce updates arriving within ~50 ms into a single Tk callback
+        self.root.after(50, self._flush_img_updates)
+    
+    def _flush_img_updates(self):
+        """Apply all queued label image updates in one pass."""
+        with self._img_updates_lock:
+            updates = self._pending_img_updates
+            self._pending_img_updates = []
+            self._flush_scheduled = False
+        
+        for label, photo, url in updates:
+            if label.winfo_exists() and getattr(label, 'cover_url', url) == url:
+                _set_label_image(label, photo)
+    
+    def _on_close(self):
+        """Stop pending image downloads and close the window."""
+        self.image_executor.shutdown(wait=False, cancel_futures=True)
+        self.http.close()
+        self.root.destroy()
     
     def _on_search_change(self, *args):
         """Handle search text changes for autocomplete."""
+        # Debounce: only search once typing pauses
+        if self._ac_after_id is not None:
+            self.root.after_cancel(self._ac_after_id)
+            self._ac_after_id = None
+        
         query = self.search_var.get()
         
         if len(query) < 2:
-            # Hide autocomplete container
-            try:
-                self.autocomplete_container.pack_info()
-                self.autocomplete_container.pack_forget()
-            except tk.TclError:
-                pass
+            self._hide_ac()
             return
         
         if self.engine is None:
             return
         
+        self._ac_after_id = self.root.after(200, self._run_autocomplete, query)
+    
+    def _run_autocomplete(self, query):
+        """Fetch autocomplete matches in the background."""
+        self._ac_after_id = None
+        
         def update_autocomplete():
             try:
-                matches = self.engine.search_books(query, limit=10)
-                self.root.after(0, lambda: self._update_autocomplete_list(matches))
+                # The engine ignores case and surrounding spaces, so normalize
+                # the cache key to let e.g. "Harry" and "harry " share an entry
+                matches = self._search_cached(query.lower().strip())
+                self.root.after(0, lambda: self._show_autocomplete_matches(query, matches))
             except Exception:
                 pass
         
         thread = threading.Thread(target=update_autocomplete, daemon=True)
         thread.start()
     
+    def _search_titles(self, query):
+        """Autocomplete search; results are memoized by _search_cached."""
+        return tuple(self.engine.search_books(query, limit=10))
+    
+    def _show_autocomplete_matches(self, query, matches):
+        """Show matches unless the search text changed in the meantime."""
+        if query == self.search_var.get():
+            self._update_autocomplete_list(matches)
+    
     def _update_autocomplete_list(self, matches):
         """Update autocomplete listbox."""
         self.autocomplete_listbox.delete(0, tk.END)
@@ -527,20 +805,21 @@ class BookRecommendationApp:
         if matches:
             for match in matches:
                 self.autocomplete_listbox.insert(tk.END, match)
-            # Show container if not already visible
-            try:
-                self.autocomplete_container.pack_info()
-            except tk.TclError:
-                # Container is not packed, pack it now
-                self.autocomplete_container.pack(fill=tk.X, pady=(5, 0))
+            self._show_ac()
         else:
-            # Hide container
-            try:
-                self.autocomplete_container.pack_info()
-                self.autocomplete_container.pack_forget()
-            except tk.TclError:
-                # Already not packed
-                pass
+            self._hide_ac()
+    
+    def _show_ac(self):
+        """Show the autocomplete container if it is hidden."""
+        if not self._ac_visible:
+            self.autocomplete_container.pack(fill=tk.X, pady=(5, 0))
+            self._ac_visible = True
+    
+    def _hide_ac(self):
+        """Hide the autocomplete container if it is shown."""
+        if self._ac_visible:
+            self.autocomplete_container.pack_forget()
+            self._ac_visible = False
     
     def _on_autocomplete_select(self, event):
         """Handle autocomplete selection."""
@@ -548,11 +827,7 @@ class BookRecommendationApp:
         if selection:
             selected_text = self.autocomplete_listbox.get(selection[0])
             self.search_var.set(selected_text)
-            # Hide autocomplete container
-            try:
-                self.autocomplete_container.pack_forget()
-            except tk.TclError:
-                pass
+            self._hide_ac()
             self._search_books()
     
     def _search_books(self):
@@ -568,21 +843,16 @@ class BookRecommendationApp:
             return
         
         # Hide autocomplete
-        try:
-            self.autocomplete_container.pack_info()
-            self.autocomplete_container.pack_forget()
-        except tk.TclError:
-            pass
+        self._hide_ac()
         
         # Clear previous results
-        for widget in self.search_scrollable_frame.winfo_children():
-            widget.destroy()
+        self._clear_search_results()
         
         # Show loading
         loading_label = tk.Label(
-            self.search_scrollable_frame,
+            self.search_content_frame,
             text="Searching for recommendations...",
-            font=tkfont.Font(family="Arial", size=12),
+            font=self.fonts['body12'],
             bg=self.colors['bg'],
             fg=self.colors['text_light']
         )
@@ -634,17 +904,16 @@ class BookRecommendationApp:
     
     def _show_search_error(self, message):
         """Show error message in search results."""
-        for widget in self.search_scrollable_frame.winfo_children():
-            widget.destroy()
+        self._clear_search_results()
         
         # Create a frame for the error message to allow wrapping
-        error_frame = tk.Frame(self.search_scrollable_frame, bg=self.colors['bg'])
+        error_frame = tk.Frame(self.search_content_frame, bg=self.colors['bg'])
         error_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=50)
         
         error_label = tk.Label(
             error_frame,
             text=message,
-            font=tkfont.Font(family="Arial", size=11),
+            font=self.fonts['body11'],
             bg=self.colors['bg'],
             fg=self.colors['error'],
             wraplength=600,
@@ -655,17 +924,16 @@ class BookRecommendationApp:
     def _display_recommendations(self, book_info, recommendations):
         """Display search results and recommendations."""
         # Clear previous content
-        for widget in self.search_scrollable_frame.winfo_children():
-            widget.destroy()
+        self._clear_search_results()
         
         # Display searched book
-        searched_frame = tk.Frame(self.search_scrollable_frame, bg=self.colors['card_bg'], relief=tk.RAISED, borderwidth=2)
+        searched_frame = tk.Frame(self.search_content_frame, bg=self.colors['card_bg'], relief=tk.RAISED, borderwidth=2)
         searched_frame.pack(fill=tk.X, padx=20, pady=20)
         
         searched_title = tk.Label(
             searched_frame,
             text="Searched Book:",
-            font=tkfont.Font(family="Arial", size=12, weight="bold"),
+            font=self.fonts['body12b'],
             bg=self.colors['card_bg'],
             fg=self.colors['text']
         )
@@ -674,7 +942,7 @@ class BookRecommendationApp:
         book_title_label = tk.Label(
             searched_frame,
             text=book_info.get('Book-Title', 'Unknown'),
-            font=tkfont.Font(family="Arial", size=14, weight="bold"),
+            font=self.fonts['h14b'],
             bg=self.colors['card_bg'],
             fg=self.colors['primary']
         )
@@ -683,7 +951,7 @@ class BookRecommendationApp:
         author_label = tk.Label(
             searched_frame,
             text=f"by {book_info.get('Book-Author', 'Unknown')}",
-            font=tkfont.Font(family="Arial", size=11),
+            font=self.fonts['body11'],
             bg=self.colors['card_bg'],
             fg=self.colors['text_light']
         )
@@ -692,99 +960,42 @@ class BookRecommendationApp:
         
         # Recommendations header
         rec_header = tk.Label(
-            self.search_scrollable_frame,
+            self.search_content_frame,
             text="Recommended Books:",
-            font=tkfont.Font(family="Arial", size=14, weight="bold"),
+            font=self.fonts['h14b'],
             bg=self.colors['bg'],
             fg=self.colors['text']
         )
         rec_header.pack(anchor=tk.W, padx=20, pady=(10, 10))
         
         # Display recommendations
-        for rec in recommendations:
-            self._create_recommendation_card(rec)
-        
-        self.search_canvas.update_idletasks()
-        # Update scroll region after content is displayed
-        self.search_canvas.configure(scrollregion=self.search_canvas.bbox("all"))
+        self.rec_cards_frame.pack(fill=tk.X)
+        for i, rec in enumerate(recommendations):
+            self._show_recommendation_card(i, rec)
+        # Layout and the scroll region are settled once at idle time by Tk's
+        # <Configure> handler; no forced update_idletasks() pass here
     
-    def _create_recommendation_card(self, rec_data):
-        """Create a recommendation card."""
-        card_frame = tk.Frame(
-            self.search_scrollable_frame,
-            bg=self.colors['card_bg'],
-            relief=tk.RAISED,
-            borderwidth=1
-        )
-        card_frame.pack(fill=tk.X, padx=20, pady=10)
-        
-        # Get book info
-        book_title = rec_data['book']
-        similarity = rec_data['similarity']
+    def _clear_search_results(self):
+        """Remove per-search widgets and hide pooled recommendation cards."""
+        for widget in self.search_content_frame.winfo_children():
+            widget.destroy()
+        self.rec_cards_frame.pack_forget()
+        for card in self._rec_card_pool:
+            card.frame.pack_forget()
+    
+    def _show_recommendation_card(self, index, rec_data):
+        """Fill and show the pooled recommendation card at the given position."""
+        if index == len(self._rec_card_pool):
+            self._rec_card_pool.append(RecommendationCard(self.rec_cards_frame, self.colors, self.fonts))
+        card = self._rec_card_pool[index]
         
         # Try to get book info
         book_info = None
         if self.engine:
-            book_info = self.engine.get_book_info(book_title)
-        
-        # Content frame
-        content_frame = tk.Frame(card_frame, bg=self.colors['card_bg'])
-        content_frame.pack(fill=tk.X, padx=20, pady=15)
-        
-        # Book title
-        title_label = tk.Label(
-            content_frame,
-            text=book_title,
-            font=tkfont.Font(family="Arial", size=12, weight="bold"),
-            bg=self.colors['card_bg'],
-            fg=self.colors['text'],
-            anchor=tk.W
-        )
-        title_label.pack(anchor=tk.W, pady=5)
-        
-        # Author
-        if book_info:
-            author_text = f"by {book_info.get('Book-Author', 'Unknown')}"
-            author_label = tk.Label(
-                content_frame,
-                text=author_text,
-                font=tkfont.Font(family="Arial", size=10),
-                bg=self.colors['card_bg'],
-                fg=self.colors['text_light'],
-                anchor=tk.W
-            )
-            author_label.pack(anchor=tk.W, pady=2)
+            book_info = self.engine.get_book_info(rec_data['book'])
         
-        # Similarity score
-        similarity_percent = similarity * 100
-        similarity_label = tk.Label(
-            content_frame,
-            text=f"Similarity: {similarity_percent:.2f}%",
-            font=tkfont.Font(family="Arial", size=10),
-            bg=self.colors['card_bg'],
-            fg=self.colors['accent'],
-            anchor=tk.W
-        )
-        similarity_label.pack(anchor=tk.W, pady=5)
-        
-        # Progress bar for similarity
-        progress_frame = tk.Frame(content_frame, bg=self.colors['card_bg'])
-        progress_frame.pack(fill=tk.X, pady=5)
-        
-        progress_canvas = tk.Canvas(
-            progress_frame,
-            height=20,
-            bg=self.colors['card_bg'],
-            highlightthickness=0
-        )
-        progress_canvas.pack(fill=tk.X)
-        
-        # Draw progress bar
-        width = 300
-        fill_width = int(width * similarity)
-        progress_canvas.create_rectangle(0, 0, width, 20, fill='#e0e0e0', outline='')
-        progress_canvas.create_rectangle(0, 0, fill_width, 20, fill=self.colors['accent'], outline='')
-
+        card.update(rec_data['book'], rec_data['similarity'], book_info)
+        card.frame.pack(fill=tk.X, padx=20, pady=10)
 
 def main():
     """Main function to run the application."""
@@ -1,16 +1,40 @@
 """
 Web version of Book Recommendation System using Flask
-Run with: python app_web.py
+Run with: python app_web.py (development server)
+      or: gunicorn -c gunicorn.conf.py app_web:app (production)
 Access at: http://localhost:5000
 """
 
 from flask import Flask, render_template, request, jsonify
+from flask.json.provider import JSONProvider
 from recommendation_engine import RecommendationEngine
+import orjson
 import os
-import numpy as np
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson, which serializes much faster than the stdlib json module."""
+    
+    @staticmethod
+    def _dump_bytes(obj):
+        # NaN becomes null and NumPy values serialize directly
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    
+    def dumps(self, obj, **kwargs):
+        return self._dump_bytes(obj).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes to the response as-is instead of decoding to str
+        # and having Flask encode them again
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._dump_bytes(obj), mimetype="application/json")
+
 
 app = Flask(__name__)
-app.config['JSONIFY_PRETTYPRINT_REGULAR'] = True
+app.json = OrjsonProvider(app)
 
 # Initialize engine (load once at startup)
 engine = None
@@ -33,7 +57,8 @@ def initialize_engine():
         # Validate engine initialization
         if not hasattr(engine, 'books_df') or engine.books_df.empty:
             raise ValueError("Books data failed to load properly")
-        if not hasattr(engine, 'ratings_df') or engine.ratings_df.empty:
+        # ratings_df is None when the models were restored from the model cache
+        if not hasattr(engine, 'ratings_df') or (engine.ratings_df is not None and engine.ratings_df.empty):
             raise ValueError("Ratings data failed to load properly")
         
         print("Engine initialized successfully!")
@@ -82,21 +107,19 @@ def get_popular_books():
                 'error': 'Maximum number of books (n) is 100'
             }), 400
         
-        books = engine.get_popular_books(n)
+        # Precomputed list of dicts; no per-request DataFrame work
+        books = engine.get_popular_book_records(n)
         
-        if books is None or books.empty:
+        if not books:
             return jsonify({
                 'success': False,
                 'error': 'No popular books found'
             }), 404
         
-        # Convert to dictionary and handle NaN values
-        books_dict = books.replace({np.nan: None}).to_dict('records')
-        
         return jsonify({
             'success': True,
-            'books': books_dict,
-            'count': len(books_dict)
+            'books': books,
+            'count': len(books)
         })
     except Exception as e:
         print(f"Error in get_popular_books: {str(e)}")
@@ -0,0 +1,18 @@
+"""
+Gunicorn configuration for the web version
+Run with: gunicorn -c gunicorn.conf.py app_web:app
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# gevent workers multiplex many connections per process
+worker_class = 'gevent'
+workers = 2 * (os.cpu_count() or 1) + 1
+worker_connections = 1000
+
+# Import app_web (and build the recommendation engine) once in the master;
+# forked workers then share the loaded model copy-on-write instead of each
+# loading the CSVs and building their own copy
+preload_app = True
@@ -5,9 +5,53 @@ Provides PopularityRecommender and CollaborativeRecommender classes
 
 import pandas as pd
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
+from scipy.sparse import csr_matrix
+from sklearn.preprocessing import normalize
+import joblib
+import functools
+import hashlib
 import pickle
 import os
+import importlib.util
+
+
+# Bump when the cached model state layout changes to invalidate old caches
+MODEL_CACHE_VERSION = 4
+
+# CSV columns loaded by RecommendationEngine
+BOOK_COLUMNS = ['ISBN', 'Book-Title', 'Book-Author', 'Image-URL-M']
+RATING_COLUMNS = ['User-ID', 'ISBN', 'Book-Rating']
+RATING_DTYPES = {'User-ID': 'int32', 'ISBN': str, 'Book-Rating': 'int8'}
+
+
+def _parquet_path(csv_path):
+    """Path of an up-to-date Parquet copy of csv_path, or None if there isn't one."""
+    # pyarrow is optional; without it the CSVs are read
+    if importlib.util.find_spec('pyarrow') is None:
+        return None
+    path = os.path.splitext(csv_path)[0] + '.parquet'
+    if os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(csv_path):
+        return path
+    return None
+
+
+def convert_csvs_to_parquet(books_csv, ratings_csv):
+    """
+    Write Zstd-compressed Parquet copies of the CSVs next to them.
+    
+    RecommendationEngine reads these instead of the CSVs when they are at
+    least as new as the CSVs and pyarrow is installed. pyarrow is an
+    optional dependency (pip install pyarrow); without it the engine keeps
+    reading the CSVs.
+    
+    Args:
+        books_csv: Path to Books.csv
+        ratings_csv: Path to Ratings.csv
+    """
+    books_df = pd.read_csv(books_csv, usecols=BOOK_COLUMNS, dtype={'ISBN': str})
+    books_df.to_parquet(os.path.splitext(books_csv)[0] + '.parquet', compression='zstd', index=False)
+    ratings_df = pd.read_csv(ratings_csv, usecols=RATING_COLUMNS, dtype=RATING_DTYPES)
+    ratings_df.to_parquet(os.path.splitext(ratings_csv)[0] + '.parquet', compression='zstd', index=False)
 
 
 class PopularityRecommender:
@@ -32,51 +76,76 @@ class PopularityRecommender:
     
     def _build_model(self):
         """Build the popularity model using weighted rating formula."""
-        # Merge books and ratings
-        book_rat = self.ratings_df.merge(self.books_df, on='ISBN')
-        
-        # Calculate number of ratings per book
-        num_rating_df = book_rat.groupby('Book-Title').count()['Book-Rating'].reset_index()
-        num_rating_df.rename(columns={'Book-Rating': 'num_rating'}, inplace=True)
+        # Attach titles to ratings; other book columns aren't needed here
+        book_rat = self.ratings_df.merge(self.books_df[['ISBN', 'Book-Title']], on='ISBN')
+        # Categorical titles let groupby work on integer codes instead of hashing strings
+        book_rat['Book-Title'] = book_rat['Book-Title'].astype('category')
         
-        # Calculate average rating per book
-        avg_rating_df = book_rat.groupby('Book-Title')['Book-Rating'].mean().reset_index()
-        avg_rating_df.rename(columns={'Book-Rating': 'avg_rating'}, inplace=True)
-        
-        # Merge to get both metrics
-        rating_df = num_rating_df.merge(avg_rating_df, on='Book-Title')
+        # Number of ratings and average rating per book in a single groupby pass
+        rating_df = book_rat.groupby('Book-Title', observed=True).agg(
+            num_rating=('Book-Rating', 'count'),
+            avg_rating=('Book-Rating', 'mean')
+        ).reset_index()
         
         # Check if we have any data
         if rating_df.empty:
             self.popular_books = pd.DataFrame(columns=['Book-Title', 'Book-Author', 'Image-URL-M', 'num_rating', 'avg_rating', 'weighted_rating'])
+            self._build_records()
             return
         
         # Calculate weighted rating: (v/(v+m)) * R + (m/(v+m)) * C
         # v = number of votes, m = minimum votes required, R = average rating, C = mean rating
-        m = rating_df['num_rating'].quantile(0.90)  # 90th percentile
-        C = rating_df['avg_rating'].mean()  # Mean rating across all books
+        v = rating_df['num_rating'].to_numpy(dtype=np.float64)
+        R = rating_df['avg_rating'].to_numpy(dtype=np.float64)
+        m = np.quantile(v, 0.90)  # 90th percentile
+        C = R.mean()  # Mean rating across all books
         
         # Handle edge cases where m or C might be NaN
-        if pd.isna(m) or pd.isna(C):
+        if np.isnan(m) or np.isnan(C):
             # If we can't calculate weighted rating, just use average rating
-            rating_df['weighted_rating'] = rating_df['avg_rating']
+            rating_df['weighted_rating'] = R
         else:
-            rating_df['weighted_rating'] = (
-                (rating_df['num_rating'] / (rating_df['num_rating'] + m)) * rating_df['avg_rating'] +
-                (m / (rating_df['num_rating'] + m)) * C
-            )
+            rating_df['weighted_rating'] = (v / (v + m)) * R + (m / (v + m)) * C
         
         # Filter by minimum ratings and sort by weighted rating
-        rating_df = rating_df[rating_df['num_rating'] >= self.min_ratings]
+        rating_df = rating_df.iloc[np.flatnonzero(v >= self.min_ratings)]
         rating_df = rating_df.sort_values('weighted_rating', ascending=False)
+        rating_df['Book-Title'] = rating_df['Book-Title'].astype(self.books_df['Book-Title'].dtype)
         
-        # Merge with book information
-        self.popular_books = rating_df.merge(
-            self.books_df, 
-            on='Book-Title'
-        ).drop_duplicates('Book-Title')[
+        # Merge with book information (first edition listed for each title)
+        book_details = self.books_df[['Book-Title', 'Book-Author', 'Image-URL-M']].drop_duplicates('Book-Title')
+        self.popular_books = rating_df.merge(book_details, on='Book-Title')[
             ['Book-Title', 'Book-Author', 'Image-URL-M', 'num_rating', 'avg_rating', 'weighted_rating']
         ]
+        # Fill the only columns that can be missing once here, so the records
+        # need no per-cell NaN scan and num_rating stays a compact integer
+        self.popular_books = self.popular_books.fillna({'Book-Author': '', 'Image-URL-M': ''}).astype({'num_rating': 'int32'})
+        self._build_records()
+    
+    def _build_records(self):
+        """Materialize popular books once as JSON-ready dicts."""
+        self._popular_records = self.popular_books.to_dict('records')
+    
+    def get_state(self):
+        """Return the fitted model state (for caching)."""
+        return {'min_ratings': self.min_ratings, 'popular_books': self.popular_books}
+    
+    @classmethod
+    def from_state(cls, books_df, state):
+        """
+        Create a recommender from cached state without rebuilding the model.
+        
+        Args:
+            books_df: DataFrame with book information
+            state: Dictionary returned by get_state()
+        """
+        recommender = cls.__new__(cls)
+        recommender.books_df = books_df
+        recommender.ratings_df = None
+        recommender.min_ratings = state['min_ratings']
+        recommender.popular_books = state['popular_books']
+        recommender._build_records()
+        return recommender
     
     def get_top_n(self, n=50):
         """
@@ -92,6 +161,22 @@ class PopularityRecommender:
             self._build_model()
         return self.popular_books.head(n).copy()
     
+    def get_top_n_records(self, n=50):
+        """
+        Get top N popular books as a list of dictionaries.
+        
+        The dictionaries are shared between calls and must not be modified.
+        
+        Args:
+            n: Number of books to return
+            
+        Returns:
+            List of dictionaries with top N popular books
+        """
+        if self.popular_books is None:
+            self._build_model()
+        return self._popular_records[:n]
+    
     def get_book_info(self, book_title):
         """
         Get information about a specific book.
@@ -137,6 +222,10 @@ class CollaborativeRecommender:
     Recommends books based on collaborative filtering using cosine similarity.
     """
     
+    # Most similar books precomputed per book, and rows scored per block
+    NEIGHBORS = 200
+    NEIGHBOR_BLOCK_SIZE = 512
+    
     def __init__(self, books_df, ratings_df, min_user_ratings=200, min_book_ratings=50):
         """
         Initialize the collaborative filtering recommender.
@@ -151,59 +240,174 @@ class CollaborativeRecommender:
         self.ratings_df = ratings_df
         self.min_user_ratings = min_user_ratings
         self.min_book_ratings = min_book_ratings
-        self.pivot_table = None
-        self.similarity_matrix = None
+        self.book_index = None
+        self.norm_matrix = None
+        self._neighbor_idx = None
+        self._neighbor_score = None
+        self._index_books()
         self._build_model()
     
+    def _index_books(self):
+        """Map each title to the position of its first row in books_df."""
+        first_rows = ~self.books_df['Book-Title'].duplicated()
+        self._book_row_by_title = dict(zip(
+            self.books_df['Book-Title'][first_rows], np.flatnonzero(first_rows)
+        ))
+    
+    def _set_empty_model(self):
+        """Reset the model to an empty state (no recommendations available)."""
+        self.book_index = pd.Index([], dtype=object)
+        self.norm_matrix = csr_matrix((0, 0), dtype=np.float32)
+        self._neighbor_idx = np.empty((0, 0), dtype=np.int32)
+        self._neighbor_score = np.empty((0, 0), dtype=np.float32)
+        self._index_titles()
+    
+    def _index_titles(self):
+        """Precompute lowercased, stripped titles for search and O(1) lookups."""
+        self._titles = self.book_index.to_numpy(dtype=object)
+        self._titles_lower = np.array([title.lower().strip() for title in self._titles], dtype=str)
+        # Case-insensitive title -> row of the first matching book
+        self._title_to_idx = {}
+        for idx, title in enumerate(self._titles_lower):
+            self._title_to_idx.setdefault(title, idx)
+    
     def _build_model(self):
         """Build the collaborative filtering model."""
-        # Merge books and ratings
-        book_rat = self.ratings_df.merge(self.books_df, on='ISBN')
+        # Attach titles to ratings; other book columns aren't needed here
+        book_rat = self.ratings_df.merge(self.books_df[['ISBN', 'Book-Title']], on='ISBN')
         
         if book_rat.empty:
-            # Create empty pivot table if no data
-            self.pivot_table = pd.DataFrame()
-            self.similarity_matrix = np.array([])
+            # No data to build a model from
+            self._set_empty_model()
             return
         
+        # Factorize titles and users once; the filters below count and mask
+        # integer codes, and the category codes index the sparse matrix
+        book_rat['Book-Title'] = book_rat['Book-Title'].astype('category')
+        book_rat['User-ID'] = book_rat['User-ID'].astype('category')
+        title_codes = book_rat['Book-Title'].cat.codes.to_numpy()
+        user_codes = book_rat['User-ID'].cat.codes.to_numpy()
+        has_title = title_codes >= 0  # -1 marks a missing title
+        
         # Filter users with at least min_user_ratings ratings
-        user_rating_counts = book_rat.groupby('User-ID').count()['Book-Rating']
-        active_users = user_rating_counts[user_rating_counts > self.min_user_ratings].index
+        user_rating_counts = np.bincount(user_codes, minlength=len(book_rat['User-ID'].cat.categories))
+        active_users = user_rating_counts > self.min_user_ratings
         
-        if len(active_users) == 0:
-            # No active users, create empty pivot table
-            self.pivot_table = pd.DataFrame()
-            self.similarity_matrix = np.array([])
+        if not active_users.any():
+            # No active users
+            self._set_empty_model()
             return
         
-        filtered_ratings = book_rat[book_rat['User-ID'].isin(active_users)]
+        user_mask = active_users[user_codes]
         
-        # Filter books with at least min_book_ratings ratings
-        book_rating_counts = filtered_ratings.groupby('Book-Title').count()['Book-Rating']
-        popular_books = book_rating_counts[book_rating_counts > self.min_book_ratings].index
+        # Filter books with at least min_book_ratings ratings from active users
+        book_rating_counts = np.bincount(
+            title_codes[user_mask & has_title],
+            minlength=len(book_rat['Book-Title'].cat.categories)
+        )
+        popular_books = book_rating_counts > self.min_book_ratings
         
-        if len(popular_books) == 0:
-            # No popular books, create empty pivot table
-            self.pivot_table = pd.DataFrame()
-            self.similarity_matrix = np.array([])
+        if not popular_books.any():
+            # No popular books
+            self._set_empty_model()
             return
         
-        final_ratings = filtered_ratings[filtered_ratings['Book-Title'].isin(popular_books)]
+        # Apply both filters in a single pass over the ratings
+        final_ratings = book_rat[user_mask & has_title & popular_books[title_codes]]
+        
+        # Sparse ratings matrix: books as rows (sorted by title), users as columns.
+        # A user may rate several editions (ISBNs) of one title; like a pivot
+        # table, average those ratings instead of summing them.
+        titles = final_ratings['Book-Title'].cat.remove_unused_categories()
+        users = final_ratings['User-ID'].cat.remove_unused_categories()
+        self.book_index = titles.cat.categories
+        book_codes = titles.cat.codes.to_numpy()
+        user_codes = users.cat.codes.to_numpy()
+        shape = (len(self.book_index), len(users.cat.categories))
+        # float32 halves memory traffic; ratings are small integers and
+        # similarities are only shown to two decimals
+        ratings = final_ratings['Book-Rating'].to_numpy(dtype=np.float32)
+        rating_sums = csr_matrix((ratings, (book_codes, user_codes)), shape=shape)
+        rating_counts = csr_matrix((np.ones_like(ratings), (book_codes, user_codes)), shape=shape)
+        rating_sums.data /= rating_counts.data
+        
+        # L2-normalize rows so a dot product between two rows is their cosine
+        # similarity
+        self.norm_matrix = normalize(rating_sums, norm='l2', axis=1, copy=False)
+        self._build_neighbors()
+        self._index_titles()
+    
+    def _build_neighbors(self):
+        """Precompute the top NEIGHBORS most similar books for every book."""
+        n_books = self.norm_matrix.shape[0]
+        k = min(self.NEIGHBORS, max(n_books - 1, 0))
+        # Rows with fewer than k similar books are padded with index -1
+        self._neighbor_idx = np.full((n_books, k), -1, dtype=np.int32)
+        self._neighbor_score = np.zeros((n_books, k), dtype=np.float32)
+        
+        # Similarities are computed a block of rows at a time so the full
+        # books x books matrix is never materialized
+        for start in range(0, n_books, self.NEIGHBOR_BLOCK_SIZE):
+            block = (self.norm_matrix[start:start + self.NEIGHBOR_BLOCK_SIZE] @ self.norm_matrix.T).toarray()
+            for offset, similarities in enumerate(block):
+                neighbors = self._top_neighbors(similarities, start + offset, k)
+                self._neighbor_idx[start + offset, :len(neighbors)] = neighbors
+                self._neighbor_score[start + offset, :len(neighbors)] = similarities[neighbors]
+    
+    @staticmethod
+    def _top_neighbors(similarities, book_index, n):
+        """
+        Indices of the n books most similar to book_index.
         
-        # Create pivot table: books as rows, users as columns
-        self.pivot_table = final_ratings.pivot_table(
-            index='Book-Title',
-            columns='User-ID',
-            values='Book-Rating',
-            fill_value=0
-        )
+        Only books with a positive similarity are returned, highest first;
+        ties are broken by index.
+        """
+        # Candidates: other books with non-zero similarity
+        candidates = np.flatnonzero(similarities > 0)
+        candidates = candidates[candidates != book_index]
+        
+        # Narrow to the top n in O(N) with argpartition, keeping every
+        # candidate tied with the n-th score so ties resolve as before
+        if 0 < n < len(candidates):
+            candidate_scores = similarities[candidates]
+            top = np.argpartition(-candidate_scores, n - 1)[:n]
+            candidates = candidates[candidate_scores >= candidate_scores[top].min()]
+        
+        # Sort only the survivors: highest similarity first, then by index
+        return candidates[np.lexsort((candidates, -similarities[candidates]))][:n]
+    
+    def get_state(self):
+        """Return the fitted model state (for caching)."""
+        return {
+            'min_user_ratings': self.min_user_ratings,
+            'min_book_ratings': self.min_book_ratings,
+            'book_index': self.book_index,
+            'norm_matrix': self.norm_matrix,
+            'neighbor_idx': self._neighbor_idx,
+            'neighbor_score': self._neighbor_score,
+        }
+    
+    @classmethod
+    def from_state(cls, books_df, state):
+        """
+        Create a recommender from cached state without rebuilding the model.
         
-        # Calculate cosine similarity between books
-        if self.pivot_table.empty or len(self.pivot_table) < 2:
-            # Need at least 2 books for similarity
-            self.similarity_matrix = np.array([])
-        else:
-            self.similarity_matrix = cosine_similarity(self.pivot_table)
+        Args:
+            books_df: DataFrame with book information
+            state: Dictionary returned by get_state()
+        """
+        recommender = cls.__new__(cls)
+        recommender.books_df = books_df
+        recommender.ratings_df = None
+        recommender.min_user_ratings = state['min_user_ratings']
+        recommender.min_book_ratings = state['min_book_ratings']
+        recommender.book_index = state['book_index']
+        recommender.norm_matrix = state['norm_matrix']
+        recommender._neighbor_idx = state['neighbor_idx']
+        recommender._neighbor_score = state['neighbor_score']
+        recommender._index_books()
+        recommender._index_titles()
+        return recommender
     
     def recommend(self, book_title, n=10):
         """
@@ -216,53 +420,41 @@ class CollaborativeRecommender:
         Returns:
             List of dictionaries with recommended books and similarity scores
         """
-        if self.pivot_table is None or self.similarity_matrix is None:
+        if self.book_index is None or self.norm_matrix is None:
             self._build_model()
         
         try:
-            # Check if pivot table is empty
-            if self.pivot_table.empty or len(self.similarity_matrix) == 0:
+            # Need at least 2 books for similarity
+            if len(self.book_index) < 2:
                 print(f"No data available for recommendations for book: {book_title}")
                 return []
             
             # Clean and normalize book title
             book_title = book_title.strip()
-            book_titles = self.pivot_table.index.str.strip()
             
-            # Check if book exists (case-insensitive)
-            book_idx = book_titles.str.lower() == book_title.lower()
-            if not any(book_idx):
+            # Look up the book (case-insensitive, first match if multiple)
+            book_index = self._title_to_idx.get(book_title.lower().strip())
+            if book_index is None:
                 print(f"Book not found in dataset: {book_title}")
                 return []
             
-            # Get index of the book (use first match if multiple)
-            book_index = np.where(book_idx)[0][0]
-            
-            # Check if similarity matrix is valid
-            if book_index >= len(self.similarity_matrix):
-                print(f"Invalid similarity matrix index for book: {book_title}")
-                return []
-            
-            # Get similarity scores for this book
-            similarity_scores = list(enumerate(self.similarity_matrix[book_index]))
-            
-            # Sort by similarity (excluding the book itself)
-            similarity_scores = sorted(similarity_scores, key=lambda x: x[1], reverse=True)
-            
-            # Filter out the book itself and books with zero similarity
-            similarity_scores = [
-                (idx, sim) for idx, sim in similarity_scores 
-                if idx != book_index and sim > 0 and idx < len(self.pivot_table.index)
-            ][:n]
+            if n <= self._neighbor_idx.shape[1]:
+                # Served from the precomputed neighbor lists
+                candidates = self._neighbor_idx[book_index, :n]
+                scores = self._neighbor_score[book_index, :n]
+                candidates, scores = candidates[candidates >= 0], scores[candidates >= 0]
+            else:
+                # More than NEIGHBORS requested: score this book against
+                # every book (sparse mat-vec)
+                similarities = (self.norm_matrix @ self.norm_matrix[book_index].T).toarray().ravel()
+                candidates = self._top_neighbors(similarities, book_index, n)
+                scores = similarities[candidates]
             
             # Build recommendations list
-            recommendations = []
-            for idx, similarity in similarity_scores:
-                book_name = self.pivot_table.index[idx]
-                recommendations.append({
-                    'book': book_name,
-                    'similarity': float(similarity)
-                })
+            recommendations = [
+                {'book': self.book_index[idx], 'similarity': float(score)}
+                for idx, score in zip(candidates, scores)
+            ]
             
             if not recommendations:
                 print(f"No similar books found for: {book_title}")
@@ -280,14 +472,10 @@ class CollaborativeRecommender:
         Returns:
             List of book titles
         """
-        if self.pivot_table is None:
+        if self.book_index is None:
             self._build_model()
         
-        # Check if pivot table is empty
-        if self.pivot_table.empty:
-            return []
-        
-        return list(self.pivot_table.index)
+        return list(self.book_index)
     
     def search_books(self, query, limit=20):
         """
@@ -303,11 +491,11 @@ class CollaborativeRecommender:
         if not query or not isinstance(query, str):
             return []
             
-        if self.pivot_table is None:
+        if self.book_index is None:
             self._build_model()
         
-        # Check if pivot table is empty
-        if self.pivot_table.empty:
+        # Check if the model is empty
+        if len(self.book_index) == 0:
             return []
         
         try:
@@ -316,31 +504,19 @@ class CollaborativeRecommender:
             if not query_lower:
                 return []
             
-            # Try exact match first (case-insensitive)
-            exact_matches = [
-                book for book in self.pivot_table.index 
-                if book.lower().strip() == query_lower
-            ]
-            
-            # Then try starts with
-            starts_with_matches = [
-                book for book in self.pivot_table.index 
-                if book.lower().strip().startswith(query_lower) 
-                and book not in exact_matches
-            ]
+            # Position of the query in every title (-1 if absent), in one C-level pass
+            positions = np.char.find(self._titles_lower, query_lower)
+            matches = np.flatnonzero(positions >= 0)
             
-            # Finally try contains
-            contains_matches = [
-                book for book in self.pivot_table.index 
-                if query_lower in book.lower().strip() 
-                and book not in exact_matches 
-                and book not in starts_with_matches
-            ]
-            
-            # Combine results in order of relevance
-            matching_books = exact_matches + starts_with_matches + contains_matches
+            # Rank by relevance: exact match, then starts with, then contains;
+            # the stable sort keeps title order within each group
+            relevance = np.where(
+                self._titles_lower[matches] == query_lower, 0,
+                np.where(positions[matches] == 0, 1, 2)
+            )
+            matches = matches[np.argsort(relevance, kind='stable')][:limit]
             
-            return matching_books[:limit]
+            return self._titles[matches].tolist()
             
         except Exception as e:
             print(f"Error in search_books: {str(e)}")
@@ -356,12 +532,12 @@ class CollaborativeRecommender:
         Returns:
             Dictionary with book information or None if not found
         """
-        book_info = self.books_df[self.books_df['Book-Title'] == book_title]
-        if book_info.empty:
+        row = self._book_row_by_title.get(book_title)
+        if row is None:
             return None
         
         # Get first match and convert to dict
-        book_dict = book_info.iloc[0].to_dict()
+        book_dict = self.books_df.iloc[row].to_dict()
         return book_dict
 
 
@@ -379,15 +555,52 @@ class RecommendationEngine:
             ratings_csv: Path to Ratings.csv
             users_csv: Path to Users.csv (optional)
         """
-        # Load data
+        self._init_query_caches()
+        
+        # Prefer Parquet copies made by convert_csvs_to_parquet(): columnar
+        # reads of just the needed columns are much faster than parsing CSV
+        books_parquet = _parquet_path(books_csv)
+        ratings_parquet = _parquet_path(ratings_csv)
+        
+        # Load data (only the columns the recommenders and UIs use)
         print("Loading books data...")
-        self.books_df = pd.read_csv(books_csv)
+        if books_parquet:
+            self.books_df = pd.read_parquet(books_parquet, columns=BOOK_COLUMNS)
+        else:
+            self.books_df = pd.read_csv(
+                books_csv,
+                usecols=BOOK_COLUMNS,
+                dtype={'ISBN': str}
+            )
         
-        print("Loading ratings data...")
-        self.ratings_df = pd.read_csv(ratings_csv)
+        # Reuse fitted models while the data files are unchanged. Ratings are
+        # only needed to fit the models, so ratings_df stays None on a cache hit.
+        cache_path = self._model_cache_path(books_parquet or books_csv, ratings_parquet or ratings_csv)
+        state = self._load_model_cache(cache_path)
+        if state is not None:
+            print("Loaded models from cache")
+            self.ratings_df = None
+            self.popularity_recommender = PopularityRecommender.from_state(self.books_df, state['pop'])
+            self.collaborative_recommender = CollaborativeRecommender.from_state(self.books_df, state['collab'])
+            print("Recommendation engine initialized successfully!")
+            return
         
-        # Filter out zero ratings
-        self.ratings_df = self.ratings_df[self.ratings_df['Book-Rating'] > 0]
+        print("Loading ratings data...")
+        if ratings_parquet:
+            # Zero ratings are filtered out while reading
+            self.ratings_df = pd.read_parquet(
+                ratings_parquet,
+                columns=RATING_COLUMNS,
+                filters=[('Book-Rating', '>', 0)]
+            )
+        else:
+            self.ratings_df = pd.read_csv(
+                ratings_csv,
+                usecols=RATING_COLUMNS,
+                dtype=RATING_DTYPES
+            )
+            # Filter out zero ratings
+            self.ratings_df = self.ratings_df[self.ratings_df['Book-Rating'] > 0]
         print(f"Ratings after filtering zeros: {len(self.ratings_df)}")
         
         # Initialize recommenders
@@ -397,21 +610,80 @@ class RecommendationEngine:
         print("Building collaborative filtering recommender...")
         self.collaborative_recommender = CollaborativeRecommender(self.books_df, self.ratings_df)
         
+        self._save_model_cache(cache_path)
+        
         print("Recommendation engine initialized successfully!")
     
+    def _init_query_caches(self):
+        """Create LRU caches for repeated recommendation, search and book-info queries."""
+        self._cached_recommendations = functools.lru_cache(maxsize=1024)(
+            lambda book_title, n: tuple(self.collaborative_recommender.recommend(book_title, n))
+        )
+        self._cached_search = functools.lru_cache(maxsize=1024)(
+            lambda query, limit: tuple(self.collaborative_recommender.search_books(query, limit))
+        )
+        self._cached_book_info = functools.lru_cache(maxsize=1024)(
+            lambda book_title: self.collaborative_recommender.get_book_info(book_title)
+        )
+    
+    @staticmethod
+    def _model_cache_path(books_path, ratings_path):
+        """Path of the model cache file for the current versions of the data files."""
+        key_parts = [str(MODEL_CACHE_VERSION)]
+        for path in (books_path, ratings_path):
+            key_parts += [os.path.abspath(path), str(os.path.getmtime(path))]
+        key = hashlib.blake2s(':'.join(key_parts).encode(), digest_size=16).hexdigest()
+        cache_dir = os.path.dirname(os.path.abspath(books_path))
+        return os.path.join(cache_dir, f'.model_cache_{key}.joblib')
+    
+    @staticmethod
+    def _load_model_cache(cache_path):
+        """Load cached model state, or return None if missing or unreadable."""
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            return joblib.load(cache_path)
+        except Exception as e:
+            print(f"Ignoring unreadable model cache: {str(e)}")
+            return None
+    
+    def _save_model_cache(self, cache_path):
+        """Save fitted model state and remove caches for older CSV versions."""
+        state = {
+            'pop': self.popularity_recommender.get_state(),
+            'collab': self.collaborative_recommender.get_state(),
+        }
+        try:
+            tmp_path = cache_path + '.tmp'
+            joblib.dump(state, tmp_path, compress=3)
+            os.replace(tmp_path, cache_path)
+            cache_dir = os.path.dirname(cache_path)
+            for name in os.listdir(cache_dir):
+                if name.startswith('.model_cache_') and name.endswith('.joblib'):
+                    path = os.path.join(cache_dir, name)
+                    if path != cache_path:
+                        os.remove(path)
+        except OSError as e:
+            print(f"Could not save model cache: {str(e)}")
+    
     def get_popular_books(self, n=50):
         """Get top N popular books."""
         return self.popularity_recommender.get_top_n(n)
     
+    def get_popular_book_records(self, n=50):
+        """Get top N popular books as a list of dictionaries (read-only)."""
+        return self.popularity_recommender.get_top_n_records(n)
+    
     def get_recommendations(self, book_title, n=10):
-        """Get recommendations for a book."""
-        return self.collaborative_recommender.recommend(book_title, n)
+        """Get recommendations for a book (cached; callers get their own copies)."""
+        return [dict(rec) for rec in self._cached_recommendations(book_title, n)]
     
     def search_books(self, query, limit=20):
-        """Search for books."""
-        return self.collaborative_recommender.search_books(query, limit)
+        """Search for books (cached)."""
+        return list(self._cached_search(query, limit))
     
     def get_book_info(self, book_title):
-        """Get book information."""
-        return self.collaborative_recommender.get_book_info(book_title)
+        """Get book information (cached; callers get their own copy)."""
+        book_info = self._cached_book_info(book_title)
+        return dict(book_info) if book_info is not None else None
 